@@ -467,7 +467,7 @@ public class BoofMemoryMapped {
 				double[] output = new double[numElements];
 				for (int i = 0; i < numElements; i++) {
 					mmf.get(data,0,data.length);
-					output[i] = bb.getFloat(0);
+					output[i] = bb.getDouble(0);
 				}
 				return output;
 			}
@@ -0,0 +1,196 @@
+/*
+ * Copyright (c) 2021, Peter Abeles. All Rights Reserved.
+ *
+ * This file is part of BoofCV (http://boofcv.org).
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package pyboof;
+
+import boofcv.abst.geo.calibration.CalibrateMonoPlanar;
+import boofcv.abst.geo.calibration.CalibrateStereoPlanar;
+import boofcv.abst.geo.calibration.ImageResults;
+import boofcv.alg.geo.calibration.CalibrationObservation;
+import boofcv.struct.calib.CameraPinhole;
+import boofcv.struct.calib.CameraPinholeBrown;
+import boofcv.struct.calib.CameraUniversalOmni;
+import boofcv.struct.geo.PointIndex2D_F64;
+
+import java.util.List;
+
+/**
+ * Static helpers which batch many small Py4J calls into a single call with primitive arrays.
+ * Crossing the Python to Java bridge is expensive, so structures which would otherwise be
+ * filled or read one element at a time from Python are handled here instead.
+ */
+public class PyBoofHelpers {
+
+    /**
+     * Adds all the points to a set of calibration observations in one call
+     *
+     * @param obs Observations that the points are added to
+     * @param which Index of each point in the calibration target
+     * @param x Observed x-coordinate of each point
+     * @param y Observed y-coordinate of each point
+     */
+    public static void addObservations(CalibrationObservation obs, int[] which, double[] x, double[] y) {
+        for (int i = 0; i < which.length; i++) {
+            obs.add(which[i], x[i], y[i]);
+        }
+    }
+
+    /**
+     * Returns all the pinhole parameters in a single array {fx, fy, skew, cx, cy, width, height}
+     */
+    public static double[] pinholeToArray(CameraPinhole c) {
+        return new double[]{c.fx, c.fy, c.skew, c.cx, c.cy, c.width, c.height};
+    }
+
+    /**
+     * Sets all the pinhole parameters from a single array {fx, fy, skew, cx, cy, width, height}
+     */
+    public static void arrayToPinhole(double[] v, CameraPinhole c) {
+        c.fx = v[0];
+        c.fy = v[1];
+        c.skew = v[2];
+        c.cx = v[3];
+        c.cy = v[4];
+        c.width = (int)v[5];
+        c.height = (int)v[6];
+    }
+
+    /**
+     * Returns pinhole plus tangential parameters in a single array
+     * {fx, fy, skew, cx, cy, width, height, t1, t2}.  Radial terms are fetched separately
+     * since their length isn't fixed.
+     */
+    public static double[] brownToArray(CameraPinholeBrown c) {
+        return new double[]{c.fx, c.fy, c.skew, c.cx, c.cy, c.width, c.height, c.t1, c.t2};
+    }
+
+    /**
+     * Sets pinhole plus tangential parameters from a single array
+     * {fx, fy, skew, cx, cy, width, height, t1, t2}.  radial can be null for no radial distortion.
+     */
+    public static void arrayToBrown(double[] v, double[] radial, CameraPinholeBrown c) {
+        arrayToPinhole(v, c);
+        c.t1 = v[7];
+        c.t2 = v[8];
+        c.radial = radial;
+    }
+
+    /**
+     * Sets universal omni parameters from a single array
+     * {fx, fy, skew, cx, cy, width, height, t1, t2, mirrorOffset}.
+     */
+    public static void arrayToUniversalOmni(double[] v, double[] radial, CameraUniversalOmni c) {
+        arrayToBrown(v, radial, c);
+        c.mirrorOffset = v[9];
+    }
+
+    /**
+     * Returns a copy of the camera model with all the distortion terms removed
+     */
+    public static CameraPinholeBrown zeroDistortionCopy(CameraPinholeBrown src) {
+        CameraPinholeBrown dst = new CameraPinholeBrown();
+        dst.fx = src.fx;
+        dst.fy = src.fy;
+        dst.skew = src.skew;
+        dst.cx = src.cx;
+        dst.cy = src.cy;
+        dst.width = src.width;
+        dst.height = src.height;
+        return dst;
+    }
+
+    /**
+     * Rebuilds one image's observations from a slice of the flattened arrays
+     */
+    private static CalibrationObservation buildObservation(int count, int target,
+                                                           int[] which, double[] x, double[] y,
+                                                           int offset) {
+        CalibrationObservation obs = new CalibrationObservation();
+        if (target >= 0)
+            obs.target = target;
+        for (int i = 0; i < count; i++) {
+            obs.add(which[offset + i], x[offset + i], y[offset + i]);
+        }
+        return obs;
+    }
+
+    /**
+     * Adds every image's observations to a monocular calibration algorithm in one call.  The
+     * per-image point lists are concatenated into flat arrays with counts[] marking the
+     * boundaries.  A target of -1 means not specified.
+     */
+    public static void addImages(CalibrateMonoPlanar alg, int[] counts, int[] targets,
+                                 int[] which, double[] x, double[] y) {
+        int offset = 0;
+        for (int image = 0; image < counts.length; image++) {
+            alg.addImage(buildObservation(counts[image], targets[image], which, x, y, offset));
+            offset += counts[image];
+        }
+    }
+
+    /**
+     * Stereo variant of {@link #addImages}.  Left and right observations are passed as two
+     * parallel sets of flattened arrays.
+     */
+    public static void addPairs(CalibrateStereoPlanar alg,
+                                int[] countsLeft, int[] targetsLeft,
+                                int[] whichLeft, double[] xLeft, double[] yLeft,
+                                int[] countsRight, int[] targetsRight,
+                                int[] whichRight, double[] xRight, double[] yRight) {
+        int offsetLeft = 0, offsetRight = 0;
+        for (int image = 0; image < countsLeft.length; image++) {
+            CalibrationObservation left = buildObservation(
+                    countsLeft[image], targetsLeft[image], whichLeft, xLeft, yLeft, offsetLeft);
+            CalibrationObservation right = buildObservation(
+                    countsRight[image], targetsRight[image], whichRight, xRight, yRight, offsetRight);
+            alg.addPair(left, right);
+            offsetLeft += countsLeft[image];
+            offsetRight += countsRight[image];
+        }
+    }
+
+    /**
+     * Flattens a set of calibration observations into {index, x, y} triplets
+     */
+    public static double[] flattenObservations(CalibrationObservation obs) {
+        List<PointIndex2D_F64> points = obs.points;
+        double[] out = new double[points.size()*3];
+        for (int i = 0; i < points.size(); i++) {
+            PointIndex2D_F64 p = points.get(i);
+            out[i*3]   = p.getIndex();
+            out[i*3+1] = p.getX();
+            out[i*3+2] = p.getY();
+        }
+        return out;
+    }
+
+    /**
+     * Flattens per-image calibration errors into {mean, max, biasX, biasY} quadruplets
+     */
+    public static double[] flattenErrors(List<ImageResults> errors) {
+        double[] out = new double[errors.size()*4];
+        for (int i = 0; i < errors.size(); i++) {
+            ImageResults r = errors.get(i);
+            out[i*4]   = r.getMeanError();
+            out[i*4+1] = r.getMaxError();
+            out[i*4+2] = r.getBiasX();
+            out[i*4+3] = r.getBiasY();
+        }
+        return out;
+    }
+}
@@ -1,27 +1,34 @@
-from pyboof.image import *
-from pyboof.ip import *
 from pyboof.geo import *
-from pyboof.recognition import *
-from pyboof.geo import real_nparray_to_ejml32
-from typing import Mapping, List
+from typing import TYPE_CHECKING, List
+import numpy as np
+
+if TYPE_CHECKING:
+    # Only needed for type annotations.  Importing pyboof.recognition at runtime would slow
+    # down cold starts with gateway class lookups this module never uses
+    from pyboof.recognition import FiducialCalibrationDetector
 
 
 def convert_from_boof_calibration_observations(jobservations):
-    # TODO For Boof 0.29 and beyond use accessors instead
-    jlist = JavaWrapper(jobservations).points
-    output = []
-    for o in jlist:
-        output.append((o.getIndex(), o.getX(), o.getY()))
-    return output
+    # Fetch all the (index, x, y) triplets in one bulk call instead of three getters per point
+    flat = java_double_array_to_python(jclasses.PyBoofHelpers.flattenObservations(jobservations))
+    return [(int(flat[i]), flat[i + 1], flat[i + 2]) for i in range(0, len(flat), 3)]
 
 
 def convert_into_boof_calibration_observations(observations):
     pixels = observations["pixels"]
-    jobs = pbg.gateway.jvm.boofcv.alg.geo.calibration.CalibrationObservation()
-    for o in pixels:
-        jobs.add(int(o[0]), float(o[1]), float(o[2]))
-        # TODO use this other accessor after 0.30
-        # jobs.add(float(o[1]),float(o[2]),int(o[0]))
+    jobs = jclasses.CalibrationObservation()
+    if pbg.mmap_file:
+        # Upload all the points as primitive arrays and add them in a single call instead of
+        # crossing the gateway once per point
+        jwhich = python_to_java_int_array([int(o[0]) for o in pixels])
+        jxs = python_to_java_double_array([float(o[1]) for o in pixels])
+        jys = python_to_java_double_array([float(o[2]) for o in pixels])
+        jclasses.PyBoofHelpers.addObservations(jobs, jwhich, jxs, jys)
+    else:
+        for o in pixels:
+            jobs.add(int(o[0]), float(o[1]), float(o[2]))
+            # TODO use this other accessor after 0.30
+            # jobs.add(float(o[1]),float(o[2]),int(o[0]))
 
     if "target" in observations:
         jobs.target = observations["target"]
@@ -29,6 +36,67 @@ def convert_into_boof_calibration_observations(observations):
     return jobs
 
 
+def _flatten_observations(observations):
+    """
+    Packs a list of observation dictionaries into flat java arrays (counts, targets, which, x, y)
+    where counts marks the per-image boundaries and target is -1 when not specified
+    """
+    counts = []
+    targets = []
+    which = []
+    xs = []
+    ys = []
+    for o in observations:
+        pixels = o["pixels"]
+        counts.append(len(pixels))
+        targets.append(int(o.get("target", -1)))
+        for p in pixels:
+            which.append(int(p[0]))
+            xs.append(float(p[1]))
+            ys.append(float(p[2]))
+    return (python_to_java_int_array(counts), python_to_java_int_array(targets),
+            python_to_java_int_array(which), python_to_java_double_array(xs),
+            python_to_java_double_array(ys))
+
+
+def _add_calibration_images(jcalib_planar, observations):
+    """
+    Adds every image's observations to the calibration algorithm.  When the memory mapped file
+    is available the whole set is streamed through the JVM with a handful of bulk copies instead
+    of bouncing between Python and Java for every image
+    """
+    if pbg.mmap_file:
+        jargs = _flatten_observations(observations)
+        jclasses.PyBoofHelpers.addImages(jcalib_planar, *jargs)
+    else:
+        for o in observations:
+            jcalib_planar.addImage(convert_into_boof_calibration_observations(o))
+
+
+# Columnar layout of the per-image calibration errors returned by convert_errors_from_boof
+CALIBRATION_ERROR_DTYPE = np.dtype([('mean', 'f8'), ('max_error', 'f8'),
+                                    ('bias_x', 'f8'), ('bias_y', 'f8')])
+
+
+def _errors_from_flat(flat):
+    """
+    Reshapes a flat sequence of {mean, max, biasX, biasY} quadruplets into a structured array
+    with the CALIBRATION_ERROR_DTYPE layout
+    """
+    return np.array(flat, dtype=np.float64).view(CALIBRATION_ERROR_DTYPE)
+
+
+def convert_errors_from_boof(jerrors):
+    """
+    Converts a java List<ImageResults> into a numpy structured array with one record per image
+    and the fields ("mean", "max_error", "bias_x", "bias_y").  Records keep supporting the old
+    dictionary style access, e.g. errors[3]["mean"], while column statistics become vector
+    operations, e.g. errors["mean"].max().  All the values are fetched in a single bulk call
+    instead of four getter crossings per image.
+    """
+    return _errors_from_flat(java_double_array_to_python(jclasses.PyBoofHelpers.flattenErrors(jerrors)))
+
+
 def calibrate_brown(width:int, height:int, observations: List, detector, num_radial=2, tangential=True, zero_skew=True):
     """
     Calibrates a Brown camera
@@ -40,22 +108,17 @@ def calibrate_brown(width:int, height:int, observations: List, detector, num_rad
     :param num_radial:
     :param tangential:
     :param zero_skew:
-    :return:
+    :return: (intrinsic, errors) where errors is a structured array, see convert_errors_from_boof()
     """
     jlayout = detector.java_obj.getLayout()
-    jcalib_planar = pbg.gateway.jvm.boofcv.abst.geo.calibration.CalibrateMonoPlanar()
+    jcalib_planar = jclasses.CalibrateMonoPlanar()
     jcalib_planar.initialize(width, height, jlayout)
     jcalib_planar.configurePinhole(zero_skew, int(num_radial), tangential)
-    for o in observations:
-        jcalib_planar.addImage(convert_into_boof_calibration_observations(o))
+    _add_calibration_images(jcalib_planar, observations)
 
     intrinsic = CameraBrown(jcalib_planar.process())
 
-    errors = []
-    for jerror in jcalib_planar.getErrors():
-        errors.append({"mean": jerror.getMeanError(),
-                       "max_error": jerror.getMaxError(),
-                       "bias_x": jerror.getBiasX(), "bias_y": jerror.getBiasY()})
+    errors = convert_errors_from_boof(jcalib_planar.getErrors())
 
     return (intrinsic, errors)
 
@@ -73,30 +136,25 @@ def calibrate_universal(width:int, height:int, observations: List, detector, num
     :param tangential:
     :param zero_skew:
     :param mirror_offset: If None it will be estimated. 0.0 = pinhole camera. 1.0 = fisheye
-    :return: (intrinsic, errors)
+    :return: (intrinsic, errors) where errors is a structured array, see convert_errors_from_boof()
     """
     jlayout = detector.java_obj.getLayout()
-    jcalib_planar = pbg.gateway.jvm.boofcv.abst.geo.calibration.CalibrateMonoPlanar()
+    jcalib_planar = jclasses.CalibrateMonoPlanar()
     jcalib_planar.initialize(width, height, jlayout)
     if mirror_offset is None:
         jcalib_planar.configureUniversalOmni(zero_skew, int(num_radial), tangential)
     else:
         jcalib_planar.configureUniversalOmni(zero_skew, int(num_radial), tangential, float(mirror_offset))
-    for o in observations:
-        jcalib_planar.addImage(convert_into_boof_calibration_observations(o))
+    _add_calibration_images(jcalib_planar, observations)
 
     intrinsic = CameraUniversalOmni(jcalib_planar.process())
 
-    errors = []
-    for jerror in jcalib_planar.getErrors():
-        errors.append({"mean": jerror.getMeanError(),
-                       "max_error": jerror.getMaxError(),
-                       "bias_x": jerror.getBiasX(), "bias_y": jerror.getBiasY()})
+    errors = convert_errors_from_boof(jcalib_planar.getErrors())
 
     return (intrinsic, errors)
 
 
-def calibrate_kannala_brandt(width:int, height:int, observations: List, detector: FiducialCalibrationDetector, num_symmetric: int = 5,
+def calibrate_kannala_brandt(width:int, height:int, observations: List, detector: 'FiducialCalibrationDetector', num_symmetric: int = 5,
                              num_asymmetric: int = 0, zero_skew: bool = True):
     """
     Calibrate a fisheye camera using Kannala-Brandt model.
@@ -109,30 +167,25 @@ def calibrate_kannala_brandt(width:int, height:int, observations: List, detector
     :param num_asymmetric:
     :param zero_skew:
     :param mirror_offset: If None it will be estimated. 0.0 = pinhole camera. 1.0 = fisheye
-    :return: (intrinsic, errors)
+    :return: (intrinsic, errors) where errors is a structured array, see convert_errors_from_boof()
     """
     jlayout = detector.java_obj.getLayout()
-    jcalib_planar = pbg.gateway.jvm.boofcv.abst.geo.calibration.CalibrateMonoPlanar()
+    jcalib_planar = jclasses.CalibrateMonoPlanar()
     jcalib_planar.initialize(width, height, jlayout)
     jcalib_planar.configureKannalaBrandt(zero_skew, num_symmetric, num_asymmetric)
 
-    for o in observations:
-        jcalib_planar.addImage(convert_into_boof_calibration_observations(o))
+    _add_calibration_images(jcalib_planar, observations)
 
     intrinsic = CameraKannalaBrandt(jcalib_planar.process())
 
-    errors = []
-    for jerror in jcalib_planar.getErrors():
-        errors.append({"mean": jerror.getMeanError(),
-                       "max_error": jerror.getMaxError(),
-                       "bias_x": jerror.getBiasX(), "bias_y": jerror.getBiasY()})
+    errors = convert_errors_from_boof(jcalib_planar.getErrors())
 
     return (intrinsic, errors)
 
 
 def calibrate_stereo(shape_left, shape_right,
-                     observations_left: List, observations_right: List, detector: FiducialCalibrationDetector,
-                     num_radial: int = 4, tangential: bool = False, zero_skew: bool = True) -> (StereoParameters, List):
+                     observations_left: List, observations_right: List, detector: 'FiducialCalibrationDetector',
+                     num_radial: int = 4, tangential: bool = False, zero_skew: bool = True) -> (StereoParameters, np.ndarray):
     """
     Calibrates a stereo camera using a Brown camera model
 
@@ -141,25 +194,25 @@ def calibrate_stereo(shape_left, shape_right,
     :param num_radial:
     :param tangential:
     :param zero_skew:
-    :return:
+    :return: (stereo_parameters, errors) where errors is a structured array, see convert_errors_from_boof()
     """
     jlayout = detector.java_obj.getLayout(0) # Hard coded for a single target
-    jcalib_planar = pbg.gateway.jvm.boofcv.abst.geo.calibration.CalibrateStereoPlanar(jlayout)
+    jcalib_planar = jclasses.CalibrateStereoPlanar(jlayout)
     jcalib_planar.configure(zero_skew, int(num_radial), tangential)
-    jcalib_planar.initialize(pbg.gateway.jvm.boofcv.struct.image.ImageDimension(shape_left[0], shape_left[1]),
-                             pbg.gateway.jvm.boofcv.struct.image.ImageDimension(shape_right[0], shape_right[1]))
+    jcalib_planar.initialize(jclasses.ImageDimension(shape_left[0], shape_left[1]),
+                             jclasses.ImageDimension(shape_right[0], shape_right[1]))
 
-    for idx in range(len(observations_left)):
-        jobs_left = convert_into_boof_calibration_observations(observations_left[idx])
-        jobs_right = convert_into_boof_calibration_observations(observations_right[idx])
-        jcalib_planar.addPair(jobs_left, jobs_right)
+    if pbg.mmap_file:
+        jargs = _flatten_observations(observations_left) + _flatten_observations(observations_right)
+        jclasses.PyBoofHelpers.addPairs(jcalib_planar, *jargs)
+    else:
+        for idx in range(len(observations_left)):
+            jobs_left = convert_into_boof_calibration_observations(observations_left[idx])
+            jobs_right = convert_into_boof_calibration_observations(observations_right[idx])
+            jcalib_planar.addPair(jobs_left, jobs_right)
 
     stereo_parameters = StereoParameters(jcalib_planar.process())
 
-    errors = []
-    for jerror in jcalib_planar.computeErrors():
-        errors.append({"mean": jerror.getMeanError(),
-                       "max_error": jerror.getMaxError(),
-                       "bias_x": jerror.getBiasX(), "bias_y": jerror.getBiasY()})
+    errors = convert_errors_from_boof(jcalib_planar.computeErrors())
 
     return (stereo_parameters, errors)
@@ -25,13 +25,118 @@ def boof_fixed_length(length):
     return pbg.gateway.jvm.boofcv.struct.ConfigLength(float(length), float(-1))
 
 
+class JavaClassCache:
+    """
+    Lazily resolved handles to frequently used JVM classes.  Every dotted lookup through
+    gateway.jvm is a reflective call into the JVM, so hot code paths should grab the class
+    handle from this cache instead of resolving it again on each invocation.  Handles are
+    discarded if the gateway is re-initialized since they belong to the old JVM.
+    """
+
+    _paths = {
+        "CameraPinholeBrown": "boofcv.struct.calib.CameraPinholeBrown",
+        "CameraUniversalOmni": "boofcv.struct.calib.CameraUniversalOmni",
+        "CameraKannalaBrandt": "boofcv.struct.calib.CameraKannalaBrandt",
+        "StereoParameters": "boofcv.struct.calib.StereoParameters",
+        "CalibrationIO": "boofcv.io.calibration.CalibrationIO",
+        "CalibrationObservation": "boofcv.alg.geo.calibration.CalibrationObservation",
+        "CalibrateMonoPlanar": "boofcv.abst.geo.calibration.CalibrateMonoPlanar",
+        "CalibrateStereoPlanar": "boofcv.abst.geo.calibration.CalibrateStereoPlanar",
+        "ImageDimension": "boofcv.struct.image.ImageDimension",
+        "LensDistortionPinhole": "boofcv.alg.distort.pinhole.LensDistortionPinhole",
+        "LensDistortionBrown": "boofcv.alg.distort.brown.LensDistortionBrown",
+        "LensDistortionUniversalOmni": "boofcv.alg.distort.universal.LensDistortionUniversalOmni",
+        "LensDistortionKannalaBrandt": "boofcv.alg.distort.kanbra.LensDistortionKannalaBrandt",
+        "LensDistortionOps": "boofcv.alg.distort.LensDistortionOps",
+        "AdjustmentType": "boofcv.alg.distort.AdjustmentType",
+        "AdjustmentType_NONE": "boofcv.alg.distort.AdjustmentType.NONE",
+        "AdjustmentType_FULL_VIEW": "boofcv.alg.distort.AdjustmentType.FULL_VIEW",
+        "AdjustmentType_EXPAND": "boofcv.alg.distort.AdjustmentType.EXPAND",
+        "NarrowToWidePtoP_F32": "boofcv.alg.distort.NarrowToWidePtoP_F32",
+        "PointToPixelTransform_F32": "boofcv.struct.distort.PointToPixelTransform_F32",
+        "Point2D_F32": "georegression.struct.point.Point2D_F32",
+        "Point2D_F64": "georegression.struct.point.Point2D_F64",
+        "Point3D_F32": "georegression.struct.point.Point3D_F32",
+        "Point3D_F64": "georegression.struct.point.Point3D_F64",
+        "PyBoofHelpers": "pyboof.PyBoofHelpers",
+    }
+
+    def __init__(self):
+        self._gateway = None
+        self._handles = {}
+
+    def __getattr__(self, name):
+        try:
+            path = self._paths[name]
+        except KeyError:
+            raise AttributeError(name)
+        if self._gateway is not pbg.gateway:
+            self._handles = {}
+            self._gateway = pbg.gateway
+        handle = self._handles.get(name)
+        if handle is None:
+            handle = pbg.gateway.jvm
+            for word in path.split("."):
+                handle = getattr(handle, word)
+            self._handles[name] = handle
+        return handle
+
+
+jclasses = JavaClassCache()
+
+
 def python_to_java_double_array(array):
+    """
+    Converts a python sequence of numbers into a java double[].  When the memory mapped file is
+    available the entire array is transferred in a single bulk copy instead of crossing the
+    gateway once for every element.
+    """
+    if pbg.mmap_file:
+        return mmap_array_python_to_java(array, pyboof.MmapType.ARRAY_F64)
     jarray = pbg.gateway.new_array(pbg.gateway.jvm.double, len(array))
     for i in range(len(array)):
         jarray[i] = array[i]
     return jarray
 
 
+def python_to_java_int_array(array):
+    """
+    Converts a python sequence of numbers into a java int[].  When the memory mapped file is
+    available the entire array is transferred in a single bulk copy instead of crossing the
+    gateway once for every element.
+    """
+    if pbg.mmap_file:
+        return mmap_array_python_to_java(array, pyboof.MmapType.ARRAY_S32)
+    jarray = pbg.gateway.new_array(pbg.gateway.jvm.int, len(array))
+    for i in range(len(array)):
+        jarray[i] = int(array[i])
+    return jarray
+
+
+def java_double_array_to_python(jarray):
+    """
+    Converts a java double[] into a python list of floats.  When the memory mapped file is
+    available the entire array is read back in a single bulk copy instead of crossing the
+    gateway once for every element.
+    """
+    if jarray is None:
+        return None
+    if not pbg.mmap_file:
+        return [float(x) for x in jarray]
+
+    num_elements = len(jarray)
+    mm = pbg.mmap_file
+
+    pbg.gateway.jvm.pyboof.PyBoofEntryPoint.mmap.write_primitive_array(jarray, pyboof.MmapType.ARRAY_F64, 0)
+    mm.seek(0)
+    data_type, num_found = struct.unpack(">HI", mm.read(2 + 4))
+    if data_type != pyboof.MmapType.ARRAY_F64:
+        raise Exception("Unexpected data type in mmap file. {%d}" % data_type)
+    if num_found != num_elements:
+        raise Exception("Unexpected number of elements returned. " + str(num_found))
+    return list(struct.unpack(">{}d".format(num_found), mm.read(8 * num_found)))
+
+
 class JavaWrapper:
     def __init__(self, java_object=None):
         self.java_obj = java_object
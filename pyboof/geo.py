@@ -62,19 +62,19 @@ class Se3_F64(JavaWrapper):
 
 
 def create_java_point_2D_f32(x=0., y=0.):
-    return pbg.gateway.jvm.georegression.struct.point.Point2D_F32(float(x), float(y))
+    return jclasses.Point2D_F32(float(x), float(y))
 
 
 def create_java_point_2D_f64(x=0., y=0.):
-    return pbg.gateway.jvm.georegression.struct.point.Point2D_F64(float(x), float(y))
+    return jclasses.Point2D_F64(float(x), float(y))
 
 
 def create_java_point_3D_f32(x=0., y=0., z=0.):
-    return pbg.gateway.jvm.georegression.struct.point.Point3D_F32(float(x), float(y), float(z))
+    return jclasses.Point3D_F32(float(x), float(y), float(z))
 
 
 def create_java_point_3D_f64(x=0., y=0., z=0.):
-    return pbg.gateway.jvm.georegression.struct.point.Point3D_F64(float(x), float(y), float(z))
+    return jclasses.Point3D_F64(float(x), float(y), float(z))
 
 
 def tuple_to_Point2D_F64(ptuple, jpoint=None):
@@ -313,8 +313,20 @@ class LineParametric2D:
             raise Exception("Unknown dtype")
 
 
-class CameraModel:
-    __metaclass__ = ABCMeta
+def _calib_load(file_name):
+    """Loads a calibration structure with CalibrationIO, skipping abspath when already absolute"""
+    file_path = file_name if os.path.isabs(file_name) else os.path.abspath(file_name)
+    return jclasses.CalibrationIO.load(file_path)
+
+
+def _calib_save(java_obj, file_name):
+    """Saves a calibration structure with CalibrationIO, skipping abspath when already absolute"""
+    file_path = file_name if os.path.isabs(file_name) else os.path.abspath(file_name)
+    jclasses.CalibrationIO.save(java_obj, file_path)
+
+
+class CameraModel(metaclass=ABCMeta):
+    __slots__ = ()
 
     @abstractmethod
     def load(self, file_name: str):
@@ -339,7 +351,11 @@ class CameraPinhole(CameraModel):
     BoofCV Intrinsic Camera parameters
     """
 
+    __slots__ = ('fx', 'fy', 'skew', 'cx', 'cy', 'width', 'height', '_scratch_boof')
+
     def __init__(self, java_object=None):
+        # Reused JVM object for convert_to_boof() so calling it every frame doesn't allocate
+        self._scratch_boof = None
         if java_object is None:
             # Intrinsic calibration matrix
             self.fx = 0
@@ -360,8 +376,7 @@ class CameraPinhole(CameraModel):
         :param file_name: Path to yaml file
         :return: this class
         """
-        file_path = os.path.abspath(file_name)
-        boof_intrinsic = pbg.gateway.jvm.boofcv.io.calibration.CalibrationIO.load(file_path)
+        boof_intrinsic = _calib_load(file_name)
 
         if boof_intrinsic is None:
             raise RuntimeError("Can't load intrinsic parameters")
@@ -370,9 +385,7 @@ class CameraPinhole(CameraModel):
         return self
 
     def save(self, file_name):
-        file_path = os.path.abspath(file_name)
-        java_obj = self.convert_to_boof()
-        pbg.gateway.jvm.boofcv.io.calibration.CalibrationIO.save(java_obj, file_path)
+        _calib_save(self.convert_to_boof(), file_name)
 
     def set_matrix(self, fx: float, fy: float, skew: float, cx: float, cy: float):
         self.fx = fx
@@ -395,31 +408,28 @@ class CameraPinhole(CameraModel):
         self.height = orig.height
 
     def set_from_boof(self, boof_intrinsic):
-        self.fx = boof_intrinsic.getFx()
-        self.fy = boof_intrinsic.getFy()
-        self.cx = boof_intrinsic.getCx()
-        self.cy = boof_intrinsic.getCy()
-        self.skew = boof_intrinsic.getSkew()
-        self.width = boof_intrinsic.getWidth()
-        self.height = boof_intrinsic.getHeight()
+        # Fetch all the parameters in a single call instead of once per getter
+        vals = java_double_array_to_python(jclasses.PyBoofHelpers.pinholeToArray(boof_intrinsic))
+        self.fx, self.fy, self.skew, self.cx, self.cy = vals[0:5]
+        self.width = int(vals[5])
+        self.height = int(vals[6])
 
     def convert_to_boof(self, storage=None):
         if storage is None:
-            boof_intrinsic = pbg.gateway.jvm.boofcv.struct.calib.CameraPinholeBrown()
+            # Note the returned object is recycled by the next call on this instance
+            if self._scratch_boof is None:
+                self._scratch_boof = jclasses.CameraPinholeBrown()
+            boof_intrinsic = self._scratch_boof
         else:
             boof_intrinsic = storage
-        boof_intrinsic.setFx(float(self.fx))
-        boof_intrinsic.setFy(float(self.fy))
-        boof_intrinsic.setCx(float(self.cx))
-        boof_intrinsic.setCy(float(self.cy))
-        boof_intrinsic.setSkew(float(self.skew))
-        boof_intrinsic.setWidth(int(self.width))
-        boof_intrinsic.setHeight(int(self.height))
+        vals = [float(self.fx), float(self.fy), float(self.skew), float(self.cx), float(self.cy),
+                float(self.width), float(self.height)]
+        jclasses.PyBoofHelpers.arrayToPinhole(python_to_java_double_array(vals), boof_intrinsic)
         return boof_intrinsic
 
     def __str__(self):
-        return "Pinhole{{ fx={:f} fy={:f} skew={:f} cx={:f} cy={:f} | width={:d} height={:d}}}".format(
-            self.fx, self.fy, self.skew, self.cx, self.cy, self.width, self.height)
+        return f"Pinhole{{ fx={self.fx:f} fy={self.fy:f} skew={self.skew:f} cx={self.cx:f} " \
+               f"cy={self.cy:f} | width={self.width:d} height={self.height:d}}}"
 
 
 class CameraBrown(CameraPinhole):
@@ -427,15 +437,18 @@ class CameraBrown(CameraPinhole):
     BoofCV Intrinsic Camera parameters
     """
 
+    __slots__ = ('radial', 't1', 't2')
+
     def __init__(self, java_object=None):
-        CameraPinhole.__init__(self, java_object)
-        if java_object is None:
-            # radial distortion
-            self.radial = None
-            # tangential terms
-            self.t1 = 0
-            self.t2 = 0
-        else:
+        # Pass None to the parent so the java object is only read once, by the
+        # set_from_boof() below which extracts the pinhole fields too
+        CameraPinhole.__init__(self, None)
+        # radial distortion
+        self.radial = None
+        # tangential terms
+        self.t1 = 0
+        self.t2 = 0
+        if java_object is not None:
             self.set_from_boof(java_object)
 
     def set_distortion(self, radial=None, t1=0, t2=0):
@@ -466,51 +479,56 @@ class CameraBrown(CameraPinhole):
         self.t2 = orig.t2
 
     def set_from_boof(self, boof_intrinsic):
-        CameraPinhole.set_from_boof(self, boof_intrinsic)
-        jarray = boof_intrinsic.getRadial()
-        if jarray is None:
-            self.radial = None
-        else:
-            self.radial = [float(x) for x in jarray]
-        self.t1 = boof_intrinsic.getT1()
-        self.t2 = boof_intrinsic.getT2()
+        vals = java_double_array_to_python(jclasses.PyBoofHelpers.brownToArray(boof_intrinsic))
+        self.fx, self.fy, self.skew, self.cx, self.cy = vals[0:5]
+        self.width = int(vals[5])
+        self.height = int(vals[6])
+        self.t1, self.t2 = vals[7:9]
+        self.radial = java_double_array_to_python(boof_intrinsic.getRadial())
 
     def convert_to_boof(self, storage=None):
         if storage is None:
-            boof_intrinsic = pbg.gateway.jvm.boofcv.struct.calib.CameraPinholeBrown()
+            if self._scratch_boof is None:
+                self._scratch_boof = jclasses.CameraPinholeBrown()
+            boof_intrinsic = self._scratch_boof
         else:
             boof_intrinsic = storage
 
-        CameraPinhole.convert_to_boof(self, boof_intrinsic)
-        if self.radial is not None:
-            jarray = pbg.gateway.new_array(pbg.gateway.jvm.double, len(self.radial))
-            for i in range(len(self.radial)):
-                jarray[i] = self.radial[i]
-            boof_intrinsic.setRadial(jarray)
-        boof_intrinsic.setT1(float(self.t1))
-        boof_intrinsic.setT2(float(self.t2))
+        vals = [float(self.fx), float(self.fy), float(self.skew), float(self.cx), float(self.cy),
+                float(self.width), float(self.height), float(self.t1), float(self.t2)]
+        jclasses.PyBoofHelpers.arrayToBrown(python_to_java_double_array(vals),
+                                            self._radial_to_java(), boof_intrinsic)
         return boof_intrinsic
 
+    def _radial_to_java(self):
+        # BoofCV treats an absent radial array as no radial distortion, so skip the upload
+        # when there are no coefficients.  All-zero arrays are uploaded as-is so the model
+        # round trips unchanged through the JVM
+        if self.radial is not None and len(self.radial) > 0:
+            return python_to_java_double_array(self.radial)
+        return None
+
     def is_distorted(self):
-        return (self.radial is not None) or self.t1 != 0 or self.t2 != 0
+        return (self.radial is not None and len(self.radial) > 0) or self.t1 != 0 or self.t2 != 0
 
     def __str__(self):
-        out = "Brown{{ fx={:f} fy={:f} skew={:f} cx={:f} cy={:f} | width={:d} height={:d} ". \
-            format(self.fx, self.fy, self.skew, self.cx, self.cy, self.width, self.height)
+        out = f"Brown{{ fx={self.fx:f} fy={self.fy:f} skew={self.skew:f} cx={self.cx:f} " \
+              f"cy={self.cy:f} | width={self.width:d} height={self.height:d} "
         if self.is_distorted():
-            out += " | radial=" + str(self.radial) + " t1=" + str(self.t1) + " t1=" + str(self.t2) + " }"
+            out += f" | radial={self.radial} t1={self.t1} t2={self.t2} }}"
         else:
-            out += "}}"
+            out += "}"
         return out
 
 
 class CameraUniversalOmni(CameraBrown):
+    __slots__ = ('mirror_offset',)
+
     def __init__(self, java_object=None):
-        CameraBrown.__init__(self, java_object)
-        if java_object is None:
-            self.mirror_offset = 0
-        else:
-            self.mirror_offset = java_object.getMirrorOffset()
+        CameraBrown.__init__(self, None)
+        self.mirror_offset = 0
+        if java_object is not None:
+            self.set_from_boof(java_object)
 
     def set_from_boof(self, boof_intrinsic):
         CameraBrown.set_from_boof(self, boof_intrinsic)
@@ -518,52 +536,54 @@ class CameraUniversalOmni(CameraBrown):
 
     def convert_to_boof(self, storage=None):
         if storage is None:
-            boof_intrinsic = pbg.gateway.jvm.boofcv.struct.calib.CameraUniversalOmni(0)
+            if self._scratch_boof is None:
+                self._scratch_boof = jclasses.CameraUniversalOmni(0)
+            boof_intrinsic = self._scratch_boof
         else:
             boof_intrinsic = storage
-        CameraBrown.convert_to_boof(self, boof_intrinsic)
-        boof_intrinsic.setMirrorOffset(float(self.mirror_offset))
+        vals = [float(self.fx), float(self.fy), float(self.skew), float(self.cx), float(self.cy),
+                float(self.width), float(self.height), float(self.t1), float(self.t2),
+                float(self.mirror_offset)]
+        jclasses.PyBoofHelpers.arrayToUniversalOmni(python_to_java_double_array(vals),
+                                                    self._radial_to_java(), boof_intrinsic)
         return boof_intrinsic
 
     def __str__(self):
-        out = "UniversalOmni{{ fx={:f} fy={:f} skew={:f} cx={:f} cy={:f} | width={:d} height={:d} | mirror={:f}". \
-            format(self.fx, self.fy, self.skew, self.cx, self.cy, self.width, self.height, self.mirror_offset)
+        out = f"UniversalOmni{{ fx={self.fx:f} fy={self.fy:f} skew={self.skew:f} cx={self.cx:f} " \
+              f"cy={self.cy:f} | width={self.width:d} height={self.height:d} | mirror={self.mirror_offset:f}"
         if self.is_distorted():
-            out += " | radial=" + str(self.radial) + " t1=" + str(self.t1) + " t1=" + str(self.t2) + " }"
+            out += f" | radial={self.radial} t1={self.t1} t2={self.t2} }}"
         else:
-            out += "}}"
+            out += "}"
         return out
 
 
 class CameraKannalaBrandt(CameraPinhole):
+    __slots__ = ('symmetric', 'radial', 'radialTrig', 'tangent', 'tangentTrig')
+
     def __init__(self, java_object=None):
-        CameraPinhole.__init__(self, java_object)
-        if java_object is None:
-            self.symmetric = []
-            self.radial = []
-            self.radialTrig = []
-            self.tangent = []
-            self.tangentTrig = []
-        else:
+        CameraPinhole.__init__(self, None)
+        self.symmetric = []
+        self.radial = []
+        self.radialTrig = []
+        self.tangent = []
+        self.tangentTrig = []
+        if java_object is not None:
             self.set_from_boof(java_object)
 
     def set_from_boof(self, boof_intrinsic):
         CameraPinhole.set_from_boof(self, boof_intrinsic)
-        jsymmetric = boof_intrinsic.getSymmetric()
-        jradial = boof_intrinsic.getRadial()
-        jradialTrig = boof_intrinsic.getRadialTrig()
-        jtangent = boof_intrinsic.getTangent()
-        jtangentTrig = boof_intrinsic.getTangentTrig()
-
-        self.symmetric = [float(x) for x in jsymmetric]
-        self.radial = [float(x) for x in jradial]
-        self.radialTrig = [float(x) for x in jradialTrig]
-        self.tangent = [float(x) for x in jtangent]
-        self.tangentTrig = [float(x) for x in jtangentTrig]
+        self.symmetric = java_double_array_to_python(boof_intrinsic.getSymmetric())
+        self.radial = java_double_array_to_python(boof_intrinsic.getRadial())
+        self.radialTrig = java_double_array_to_python(boof_intrinsic.getRadialTrig())
+        self.tangent = java_double_array_to_python(boof_intrinsic.getTangent())
+        self.tangentTrig = java_double_array_to_python(boof_intrinsic.getTangentTrig())
 
     def convert_to_boof(self, storage=None):
         if storage is None:
-            boof_intrinsic = pbg.gateway.jvm.boofcv.struct.calib.CameraKannalaBrandt(len(self.symmetric), len(self.radial))
+            if self._scratch_boof is None:
+                self._scratch_boof = jclasses.CameraKannalaBrandt(len(self.symmetric), len(self.radial))
+            boof_intrinsic = self._scratch_boof
         else:
             boof_intrinsic = storage
         CameraPinhole.convert_to_boof(self, boof_intrinsic)
@@ -575,10 +595,10 @@ class CameraKannalaBrandt(CameraPinhole):
         return boof_intrinsic
 
     def __str__(self):
-        out = "CameraKannalaBrandt{{ fx={:f} fy={:f} skew={:f} cx={:f} cy={:f} | width={:d} height={:d}". \
-            format(self.fx, self.fy, self.skew, self.cx, self.cy, self.width, self.height)
-        out += " | symmetric=" + str(self.symmetric) + " radial=" + str(self.radial) + " radialTrig=" + \
-               str(self.radialTrig) + " tangent=" + str(self.tangent) + " tangentTrig=" + str(self.tangentTrig) + " }}"
+        out = f"CameraKannalaBrandt{{ fx={self.fx:f} fy={self.fy:f} skew={self.skew:f} cx={self.cx:f} " \
+              f"cy={self.cy:f} | width={self.width:d} height={self.height:d}"
+        out += f" | symmetric={self.symmetric} radial={self.radial} radialTrig={self.radialTrig} " \
+               f"tangent={self.tangent} tangentTrig={self.tangentTrig} }}"
         return out
 
 
@@ -587,6 +607,8 @@ class StereoParameters(CameraModel):
     Stereo intrinsic and extrinsic parameters
     """
 
+    __slots__ = ('left', 'right', 'right_to_left')
+
     def __init__(self, java_object=None):
         if java_object is None:
             self.left = CameraBrown()
@@ -596,17 +618,14 @@ class StereoParameters(CameraModel):
             self.set_from_boof(java_object)
 
     def load(self, file_name: str):
-        file_path = os.path.abspath(file_name)
-        boof_parameters = pbg.gateway.jvm.boofcv.io.calibration.CalibrationIO.load(file_path)
+        boof_parameters = _calib_load(file_name)
 
         if boof_parameters is None:
             raise RuntimeError("Can't load stereo parameters")
         self.set_from_boof(boof_parameters)
 
     def save(self, file_name: str):
-        file_path = os.path.abspath(file_name)
-        java_obj = self.convert_to_boof()
-        pbg.gateway.jvm.boofcv.io.calibration.CalibrationIO.save(java_obj, file_path)
+        _calib_save(self.convert_to_boof(), file_name)
 
     def set_from_boof(self, boof_parameters):
         self.left = CameraBrown(boof_parameters.left)
@@ -615,7 +634,7 @@ class StereoParameters(CameraModel):
 
     def convert_to_boof(self, storage=None):
         if storage is None:
-            boof_parameters = pbg.gateway.jvm.boofcv.struct.calib.StereoParameters()
+            boof_parameters = jclasses.StereoParameters()
             # In BoofCV 0.40 StereoParameters will not be initialized with null and this will not be needed
             boof_parameters.setLeft(CameraBrown().convert_to_boof())
             boof_parameters.setRight(CameraBrown().convert_to_boof())
@@ -628,7 +647,7 @@ class StereoParameters(CameraModel):
         return boof_parameters
 
     def __str__(self):
-        return "StereoParameters(left={} right={} right_to_left={})".format(self.left, self.right, self.right_to_left)
+        return f"StereoParameters(left={self.left} right={self.right} right_to_left={self.right_to_left})"
 
 
 class LensNarrowDistortionFactory(JavaWrapper):
@@ -697,8 +716,97 @@ class LensWideDistortionFactory(JavaWrapper):
         return Transform2to3(java_out)
 
 
+def _camera_model_fingerprint(camera_model):
+    """Hashable tuple capturing a camera model's values.  Used as a memoization key."""
+    return (type(camera_model).__name__,
+            camera_model.fx, camera_model.fy, camera_model.skew,
+            camera_model.cx, camera_model.cy, camera_model.width, camera_model.height,
+            tuple(getattr(camera_model, "radial", None) or ()),
+            getattr(camera_model, "t1", 0), getattr(camera_model, "t2", 0),
+            getattr(camera_model, "mirror_offset", None),
+            tuple(getattr(camera_model, "symmetric", None) or ()),
+            tuple(getattr(camera_model, "radialTrig", None) or ()),
+            tuple(getattr(camera_model, "tangent", None) or ()),
+            tuple(getattr(camera_model, "tangentTrig", None) or ()))
+
+
+# Memoized JVM lens distortion objects keyed on the camera model's values.  Only the immutable
+# JVM handle is cached, never the python factory wrapping it, since the wrapper carries mutable
+# state such as use_32.  Bounded so sweeping through many unique camera models doesn't pin JVM
+# objects forever
+_distorter_cache = {}
+_distorter_cache_gateway = None
+_DISTORTER_CACHE_SIZE = 16
+
+
+def _distorter_cache_get(key):
+    global _distorter_cache_gateway
+    if _distorter_cache_gateway is not pbg.gateway:
+        _distorter_cache.clear()
+        _distorter_cache_gateway = pbg.gateway
+    return _distorter_cache.get(key)
+
+
+def _distorter_cache_put(key, java_obj):
+    if len(_distorter_cache) >= _DISTORTER_CACHE_SIZE:
+        _distorter_cache.clear()
+    _distorter_cache[key] = java_obj
+
+
+def invalidate_distorter_cache():
+    """Forgets all memoized JVM lens distortion objects"""
+    _distorter_cache.clear()
+
+
+def _narrow_distorter_pinhole(camera_model):
+    # Convert into a private JVM object so the cached distorter isn't aliased with the
+    # model's recycled scratch storage
+    boof_model = camera_model.convert_to_boof(jclasses.CameraPinholeBrown())
+    return jclasses.LensDistortionPinhole(boof_model)
+
+
+def _narrow_distorter_brown(camera_model):
+    boof_model = camera_model.convert_to_boof(jclasses.CameraPinholeBrown())
+    if camera_model.is_distorted():
+        return jclasses.LensDistortionBrown(boof_model)
+    else:
+        return jclasses.LensDistortionPinhole(boof_model)
+
+
+def _wide_distorter_universal_omni(camera_model):
+    boof_model = camera_model.convert_to_boof(jclasses.CameraUniversalOmni(0))
+    return jclasses.LensDistortionUniversalOmni(boof_model)
+
+
+def _wide_distorter_kannala_brandt(camera_model):
+    boof_model = camera_model.convert_to_boof(
+        jclasses.CameraKannalaBrandt(len(camera_model.symmetric), len(camera_model.radial)))
+    return jclasses.LensDistortionKannalaBrandt(boof_model)
+
+
+# Maps a camera model class to the function which builds its JVM lens distorter.  Dispatch walks
+# the MRO so subclasses resolve to the closest known model, e.g. a distorted CameraBrown gets
+# LensDistortionBrown instead of falling through to the pinhole branch
+_NARROW_DISTORTER_DISPATCH = {CameraBrown: _narrow_distorter_brown,
+                              CameraPinhole: _narrow_distorter_pinhole}
+
+_WIDE_DISTORTER_DISPATCH = {CameraUniversalOmni: _wide_distorter_universal_omni,
+                            CameraKannalaBrandt: _wide_distorter_kannala_brandt}
+
+
+def _lookup_distorter_builder(dispatch, camera_model):
+    for cls in type(camera_model).__mro__:
+        builder = dispatch.get(cls)
+        if builder is not None:
+            return builder
+    raise RuntimeError("Unknown camera model {}".format(type(camera_model)))
+
+
 def create_narrow_lens_distorter(camera_model):
     """
+    The JVM lens distortion object is memoized on the camera model's values, so repeated calls
+    with an unchanged model reuse it instead of rebuilding it.  Every call returns a fresh
+    factory so flags like use_32 are never shared between callers.
 
     :param camera_model:
     :return:
@@ -706,37 +814,30 @@ def create_narrow_lens_distorter(camera_model):
     """
     if isinstance(camera_model, CameraUniversalOmni):
         raise RuntimeError("CameraUniversalOmni is not a narrow FOV camera model")
-    elif isinstance(camera_model, CameraPinhole):
-        boof_model = camera_model.convert_to_boof()
-        java_obj = pbg.gateway.jvm.boofcv.alg.distort.pinhole.LensDistortionPinhole(boof_model)
-    elif isinstance(camera_model, CameraBrown):
-        boof_model = camera_model.convert_to_boof()
-        if camera_model.is_distorted():
-            java_obj = pbg.gateway.jvm.boofcv.alg.distort.brown.LensDistortionBrown(boof_model)
-        else:
-            java_obj = pbg.gateway.jvm.boofcv.alg.distort.pinhole.LensDistortionPinhole(boof_model)
-    else:
-        raise RuntimeError("Unknown camera model {}".format(type(camera_model)))
 
+    key = ("narrow",) + _camera_model_fingerprint(camera_model)
+    java_obj = _distorter_cache_get(key)
+    if java_obj is None:
+        java_obj = _lookup_distorter_builder(_NARROW_DISTORTER_DISPATCH, camera_model)(camera_model)
+        _distorter_cache_put(key, java_obj)
     return LensNarrowDistortionFactory(java_obj)
 
 
 def create_wide_lens_distorter(camera_model):
     """
+    The JVM lens distortion object is memoized on the camera model's values, so repeated calls
+    with an unchanged model reuse it instead of rebuilding it.  Every call returns a fresh
+    factory so flags like use_32 are never shared between callers.
 
     :param camera_model:
     :return:
     :rtype: LensWideDistortionFactory
     """
-    if isinstance(camera_model, CameraUniversalOmni):
-        boof_model = camera_model.convert_to_boof()
-        java_obj = pbg.gateway.jvm.boofcv.alg.distort.universal.LensDistortionUniversalOmni(boof_model)
-    elif isinstance(camera_model, CameraKannalaBrandt):
-        boof_model = camera_model.convert_to_boof()
-        java_obj = pbg.gateway.jvm.boofcv.alg.distort.kanbra.LensDistortionKannalaBrandt(boof_model)
-    else:
-        raise RuntimeError("Unknown camera model {}".format(type(camera_model)))
-
+    key = ("wide",) + _camera_model_fingerprint(camera_model)
+    java_obj = _distorter_cache_get(key)
+    if java_obj is None:
+        java_obj = _lookup_distorter_builder(_WIDE_DISTORTER_DISPATCH, camera_model)(camera_model)
+        _distorter_cache_put(key, java_obj)
     return LensWideDistortionFactory(java_obj)
 
 
@@ -759,8 +860,8 @@ class NarrowToWideFovPtoP(JavaWrapper):
         """
         narrow_distort = create_narrow_lens_distorter(narrow_model)
         wide_distort = create_wide_lens_distorter(wide_model)
-        java_object = pbg.gateway.jvm.boofcv.alg.distort.NarrowToWidePtoP_F32(narrow_distort.java_obj,
-                                                                          wide_distort.java_obj)
+        java_object = jclasses.NarrowToWidePtoP_F32(narrow_distort.java_obj,
+                                                    wide_distort.java_obj)
         JavaWrapper.__init__(self, java_object)
 
     def set_rotation_wide_to_narrow(self, rotation_matrix):
@@ -787,7 +888,7 @@ class NarrowToWideFovPtoP(JavaWrapper):
         java_interp = FactoryInterpolation(image_type).bilinear(border_type=border_type)
 
         java_alg = pbg.gateway.jvm.boofcv.factory.distort.FactoryDistort.distort(False, java_interp, java_image_type)
-        java_pixel_transform = pbg.gateway.jvm.boofcv.struct.distort.PointToPixelTransform_F32(self.java_obj)
+        java_pixel_transform = jclasses.PointToPixelTransform_F32(self.java_obj)
         java_alg.setModel(java_pixel_transform)
         return ImageDistort(java_alg)
 
@@ -798,14 +899,17 @@ class AdjustmentType:
     EXPAND = 2
 
 
+# Maps the python constants to cached handles of the JVM enum values, avoiding a valueOf()
+# gateway call on every conversion
+_ADJUSTMENT_TO_JAVA = {AdjustmentType.NONE: "AdjustmentType_NONE",
+                       AdjustmentType.FULL_VIEW: "AdjustmentType_FULL_VIEW",
+                       AdjustmentType.EXPAND: "AdjustmentType_EXPAND"}
+
+
 def adjustment_to_java(value):
-    if value == AdjustmentType.NONE:
-        return pbg.gateway.jvm.boofcv.alg.distort.AdjustmentType.valueOf("NONE")
-    elif value == AdjustmentType.FULL_VIEW:
-        return pbg.gateway.jvm.boofcv.alg.distort.AdjustmentType.valueOf("FULL_VIEW")
-    elif value == AdjustmentType.EXPAND:
-        return pbg.gateway.jvm.boofcv.alg.distort.AdjustmentType.valueOf("EXPAND")
-    else:
+    try:
+        return getattr(jclasses, _ADJUSTMENT_TO_JAVA[value])
+    except KeyError:
         raise RuntimeError("Unknown type")
 
 
@@ -829,12 +933,12 @@ def remove_distortion(input, output, intrinsic, adjustment=AdjustmentType.FULL_V
     :rtype: CameraPinhole
     """
     image_type = ImageType(input.getImageType())
-    desired = CameraPinhole()
-    desired.set(intrinsic)
-    desired.radial = [0, 0]
-    desired.t1 = desired.t2 = 0
+    # Build the zero-distortion target directly in the JVM rather than converting a shadow
+    # python camera model
+    java_original = intrinsic.convert_to_boof()
+    java_desired = jclasses.PyBoofHelpers.zeroDistortionCopy(java_original)
 
-    distorter, intrinsic_out = create_change_camera_model(intrinsic, desired, image_type, adjustment, border)
+    distorter, intrinsic_out = _change_camera_model(java_original, java_desired, image_type, adjustment, border)
     distorter.apply(input, output)
     return intrinsic_out
 
@@ -859,13 +963,18 @@ def create_change_camera_model(intrinsic_orig, intrinsic_desired, image_type,
     :rtype: (ImageDistort,CameraPinhole)
     """
 
+    java_original = intrinsic_orig.convert_to_boof()
+    java_desired = intrinsic_desired.convert_to_boof()
+    return _change_camera_model(java_original, java_desired, image_type, adjustment, border)
+
+
+def _change_camera_model(java_original, java_desired, image_type, adjustment, border):
+    """Java-side version of create_change_camera_model() which takes already converted models"""
     java_image_type = image_type.get_java_object()
     java_adjustment = adjustment_to_java(adjustment)
     java_border = border_to_java(border)
-    java_original = intrinsic_orig.convert_to_boof()
-    java_desired = intrinsic_desired.convert_to_boof()
-    java_intrinsic_out = pbg.gateway.jvm.boofcv.struct.calib.CameraPinholeBrown()
-    id = pbg.gateway.jvm.boofcv.alg.distort.LensDistortionOps.changeCameraModel(
+    java_intrinsic_out = jclasses.CameraPinholeBrown()
+    id = jclasses.LensDistortionOps.changeCameraModel(
         java_adjustment, java_border, java_original, java_desired, java_intrinsic_out, java_image_type)
     return (ImageDistort(id), CameraPinhole(java_intrinsic_out))
 
@@ -2,15 +2,35 @@
 
 import unittest
 
-# from pyboof import pbg
-# import pyboof as pb
-# import numpy as np
-# import os
+import pyboof as pb
+from pyboof.calib import _errors_from_flat
 
 # TODO calibrate_brown
 # TODO calibrate_universal
 # TODO calibrate_kannala_brandt
 # TODO calibrate_stereo
 
-# if __name__ == '__main__':
-#     unittest.main()
+class ConvertErrors(unittest.TestCase):
+    def test_errors_from_flat(self):
+        flat = [0.5, 2.0, 0.1, -0.2,
+                1.5, 3.0, 0.0, 0.4]
+        errors = _errors_from_flat(flat)
+
+        self.assertEqual(pb.CALIBRATION_ERROR_DTYPE, errors.dtype)
+        self.assertEqual(2, len(errors))
+        # record style access keeps working like the old list of dictionaries
+        self.assertEqual(0.5, errors[0]["mean"])
+        self.assertEqual(3.0, errors[1]["max_error"])
+        self.assertEqual(2.0, sum(x["mean"] for x in errors))
+        # column statistics are vector operations
+        self.assertEqual(3.0, errors["max_error"].max())
+        self.assertEqual(-0.2, errors["bias_y"].min())
+
+    def test_errors_from_flat_empty(self):
+        errors = _errors_from_flat([])
+
+        self.assertEqual(pb.CALIBRATION_ERROR_DTYPE, errors.dtype)
+        self.assertEqual(0, len(errors))
+
+if __name__ == '__main__':
+    unittest.main()
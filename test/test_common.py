@@ -57,6 +57,14 @@ class ArrayTransfer(unittest.TestCase):
         for i in range(len(pyarray)):
             self.assertEqual(pyarray[i], np.float32(jarray[i]))
 
+    def test_mmap_array_python_to_java_F64(self):
+        pyarray = np.float64([1.0, 0.0, 1.059e3, -102.034, -9.3243])
+        jarray = pb.mmap_array_python_to_java(pyarray, pb.MmapType.ARRAY_F64)
+
+        self.assertEqual(5, len(jarray))
+        for i in range(len(pyarray)):
+            self.assertEqual(pyarray[i], np.float64(jarray[i]))
+
     def test_mmap_array_java_to_python_U8(self):
         pyarray = np.uint8([1, 0, 255, 100, 199])
         jarray  = pb.mmap_array_python_to_java(pyarray, pb.MmapType.ARRAY_U8)
@@ -93,5 +101,22 @@ class ArrayTransfer(unittest.TestCase):
         for i in range(len(pyfound)):
             self.assertEqual(np.float32(pyarray[i]), pyfound[i])
 
+    def test_python_to_java_int_array(self):
+        pyarray = [1, 0, 1999394, -10, -99384]
+        jarray = pb.python_to_java_int_array(pyarray)
+
+        self.assertEqual(5, len(jarray))
+        for i in range(len(pyarray)):
+            self.assertEqual(pyarray[i], np.int32(jarray[i]))
+
+    def test_java_double_array_to_python(self):
+        pyarray = [1.0, 0.0, 1.059e3, -102.034, -9.3243]
+        jarray  = pb.python_to_java_double_array(pyarray)
+        pyfound = pb.java_double_array_to_python(jarray)
+
+        self.assertEqual(5, len(pyfound))
+        for i in range(len(pyfound)):
+            self.assertEqual(pyarray[i], pyfound[i])
+
 if __name__ == '__main__':
     unittest.main()